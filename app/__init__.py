@@ -10,7 +10,7 @@ from app.db_connection import get_db
 def create_app(test_config=None):
     # create and configure the app
     app = Flask(__name__, instance_relative_config=True)
-    CORS(app)
+    CORS(app, expose_headers=["ETag"])
     app.config.from_mapping(
         SECRET_KEY="dev",
         DATABASE=os.path.join(app.instance_path, "flaskr.sqlite"),
@@ -26,10 +26,22 @@ def create_app(test_config=None):
     import app.db_connection as db_connection
     db_client = get_db(Config.mongo_connection_string)
     db_connection.db = db_client[Config.mongo_database_name]
+    db_connection.read_db = db_connection.db.with_options(
+        read_preference=db_connection.read_preference(
+            Config.mongo_read_preference, Config.mongo_max_staleness_seconds
+        )
+    )
 
     # So MCP subprocess uses the same datasource when SummaryClient spawns it
     os.environ["MONGO_CONNECTION_STRING"] = Config.mongo_connection_string
     os.environ["MONGO_DATABASE_NAME"] = Config.mongo_database_name
+    os.environ["MONGO_READ_PREFERENCE"] = Config.mongo_read_preference
+    os.environ["MONGO_MAX_STALENESS_SECONDS"] = str(Config.mongo_max_staleness_seconds)
+
+    from app.ainara import tracing
+    tracing.configure(Config.trace_file)
+    if Config.trace_file:
+        os.environ[tracing.TRACE_FILE_ENV] = Config.trace_file
 
     # ensure the instance folder exists
     os.makedirs(app.instance_path, exist_ok=True)
@@ -37,4 +49,11 @@ def create_app(test_config=None):
     from app.routes import api_bp
     app.register_blueprint(api_bp)
 
+    from app.commands import register_commands
+    register_commands(app)
+
+    if app.config.get("PRELOAD_SUMMARY_STACK", Config.preload_summary_stack):
+        from app.services.case_service import preload_summary_stack
+        preload_summary_stack()
+
     return app
@@ -0,0 +1,141 @@
+"""
+Elección del modelo de Claude según el tamaño del caso y registro de latencia, tokens y coste por ruta.
+Sin dependencias de anthropic/mcp: la decisión se puede probar de forma aislada.
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+logger = logging.getLogger("model_router")
+
+# Bytes UTF-8 por token (aprox. para texto en español) y tokens fijos de prompt + herramientas
+BYTES_PER_TOKEN = 4
+PROMPT_OVERHEAD_TOKENS = 1500
+PER_DOCUMENT_OVERHEAD_TOKENS = 15
+
+# USD por millón de tokens (entrada, salida)
+MODEL_PRICES_PER_MTOK = {
+    "claude-3-haiku-20240307": (0.25, 1.25),
+    "claude-3-5-haiku-20241022": (0.80, 4.00),
+    "claude-sonnet-4-20250514": (3.00, 15.00),
+}
+
+
+@dataclass(frozen=True)
+class Route:
+    """Ruta elegida para un caso: nombre (fast/strong), modelo y estimación que la motivó."""
+
+    name: str
+    model: str
+    estimated_input_tokens: int
+    document_count: int
+
+
+@dataclass
+class RouteMetrics:
+    """Métricas de una ejecución de resumen por una ruta."""
+
+    case_id: str
+    route: str
+    model: str
+    estimated_input_tokens: int
+    document_count: int
+    input_tokens: int = 0
+    output_tokens: int = 0
+    turns: int = 0
+    latency_ms: float = 0.0
+    cost_usd: float = 0.0
+    started_at: float = field(default_factory=time.time)
+
+    def add_usage(self, usage) -> None:
+        """Acumula el `usage` de una respuesta de messages.create."""
+        self.turns += 1
+        if usage is None:
+            return
+        self.input_tokens += getattr(usage, "input_tokens", 0) or 0
+        self.output_tokens += getattr(usage, "output_tokens", 0) or 0
+
+    def finish(self, latency_ms: float) -> None:
+        self.latency_ms = latency_ms
+        price_in, price_out = MODEL_PRICES_PER_MTOK.get(self.model, (0.0, 0.0))
+        self.cost_usd = (self.input_tokens * price_in + self.output_tokens * price_out) / 1_000_000
+
+
+class ModelRouter:
+    """
+    Casos pequeños (pocas entradas y pocos tokens estimados) van al modelo rápido;
+    el resto, o si no se conoce el tamaño, al modelo fuerte.
+    Los modelos y umbrales por defecto están en Config (usar from_config).
+    """
+
+    def __init__(
+        self,
+        fast_model: str,
+        strong_model: str,
+        fast_max_input_tokens: int,
+        fast_max_documents: int,
+        metrics_file: Optional[str] = None,
+    ):
+        self.fast_model = fast_model
+        self.strong_model = strong_model
+        self.fast_max_input_tokens = fast_max_input_tokens
+        self.fast_max_documents = fast_max_documents
+        self.metrics_file = metrics_file
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config) -> "ModelRouter":
+        return cls(
+            fast_model=config.summary_fast_model,
+            strong_model=config.summary_strong_model,
+            fast_max_input_tokens=config.summary_fast_max_input_tokens,
+            fast_max_documents=config.summary_fast_max_documents,
+            metrics_file=config.summary_metrics_file,
+        )
+
+    @staticmethod
+    def estimate_input_tokens(document_count: int, text_size: int) -> int:
+        """Tokens de entrada estimados a partir del tamaño del texto del caso (bytes UTF-8)."""
+        return (
+            PROMPT_OVERHEAD_TOKENS
+            + document_count * PER_DOCUMENT_OVERHEAD_TOKENS
+            + text_size // BYTES_PER_TOKEN
+        )
+
+    def route(self, document_count: Optional[int], text_size: Optional[int]) -> Route:
+        if document_count is None or text_size is None:
+            return Route("strong", self.strong_model, 0, 0)
+        tokens = self.estimate_input_tokens(document_count, text_size)
+        if document_count <= self.fast_max_documents and tokens <= self.fast_max_input_tokens:
+            return Route("fast", self.fast_model, tokens, document_count)
+        return Route("strong", self.strong_model, tokens, document_count)
+
+    def start(self, case_id: str, route: Route) -> RouteMetrics:
+        return RouteMetrics(
+            case_id=case_id,
+            route=route.name,
+            model=route.model,
+            estimated_input_tokens=route.estimated_input_tokens,
+            document_count=route.document_count,
+        )
+
+    def record(self, metrics: RouteMetrics) -> None:
+        """Registra las métricas en el log y, si está configurado, como una línea JSON en metrics_file."""
+        logger.info(
+            "summary route=%s model=%s docs=%d est_tokens=%d in=%d out=%d turns=%d latency_ms=%.0f cost_usd=%.5f",
+            metrics.route, metrics.model, metrics.document_count, metrics.estimated_input_tokens,
+            metrics.input_tokens, metrics.output_tokens, metrics.turns, metrics.latency_ms, metrics.cost_usd,
+        )
+        if not self.metrics_file:
+            return
+        line = json.dumps(asdict(metrics), ensure_ascii=False)
+        try:
+            with self._lock, open(self.metrics_file, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            logger.warning("No se pudieron guardar las métricas de resumen en %s: %s", self.metrics_file, e)
+
@@ -5,9 +5,12 @@ Usado desde el endpoint POST /api/summary y desde la CLI (client-claude.py).
 """
 
 import asyncio
+import json
 import logging
 import os
 import re
+import time
+from contextlib import AsyncExitStack
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -15,6 +18,13 @@ from anthropic import AsyncAnthropic
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+try:
+    from app.ainara import tracing
+    from app.ainara.model_router import ModelRouter, RouteMetrics
+except ImportError:
+    import tracing
+    from model_router import ModelRouter, RouteMetrics
+
 load_dotenv()
 
 logger = logging.getLogger("summary_client")
@@ -22,13 +32,15 @@ logger.setLevel(logging.INFO)
 logging.getLogger("anthropic").setLevel(logging.WARNING)
 logging.getLogger("pymongo").setLevel(logging.WARNING)
 
-MODEL_ID = "claude-sonnet-4-20250514"
+OVERVIEW_TOOL = "get_case_overview"
 
 
 class SummaryClient:
     """
     Cliente para generar el resumen de un caso (modo a petición).
     Conecta a MCP, llama a Claude con herramientas y devuelve el texto del resumen.
+    El modelo se elige por caso con `router` (ver model_router.py); `anthropic_client`
+    permite inyectar un cliente (p. ej. uno falso en pruebas).
     """
 
     def __init__(
@@ -36,10 +48,17 @@ class SummaryClient:
         api_key: str | None = None,
         path_python: str | None = None,
         path_server: str | None = None,
+        router: ModelRouter | None = None,
+        anthropic_client=None,
     ):
         self._api_key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
-        if not self._api_key:
+        if not self._api_key and anthropic_client is None:
             raise ValueError("ANTHROPIC_API_KEY is not set")
+        if router is None:
+            from app.config import Config
+            router = ModelRouter.from_config(Config)
+        self._router = router
+        self._anthropic_client = anthropic_client
         base_dir = Path(__file__).resolve().parent
         self._path_python = path_python or os.environ.get("MCP_PYTHON", "python")
         self._path_server = path_server or str(base_dir / "server.py")
@@ -119,6 +138,31 @@ class SummaryClient:
 """
         )
 
+    async def _get_case_size(self, mcp_session: ClientSession, tool_names: set, case_id: str):
+        """
+        (nº de documentos, bytes de texto) del caso vía get_case_overview; (None, None) si no se puede
+        o si el caso no tiene case_stats (p. ej. datos importados con mongoimport sin rebuild-case-stats).
+        """
+        if OVERVIEW_TOOL not in tool_names:
+            return None, None
+        try:
+            res = await self._call_tool(mcp_session, OVERVIEW_TOOL, {"case_id": case_id})
+            overview = json.loads(res.content[0].text)
+            if not overview.get("exists"):
+                return None, None
+            return overview["total_docs"], overview["text_size"]
+        except Exception as e:
+            logger.warning("No se pudo estimar el tamaño del caso %s: %s", case_id, e)
+            return None, None
+
+    @staticmethod
+    async def _call_tool(mcp_session: ClientSession, name: str, args: dict):
+        """call_tool con span propio; el traceparent viaja en _meta para enlazar los spans de server.py."""
+        with tracing.span("mcp.call_tool", tool=name):
+            return await mcp_session.call_tool(
+                name, arguments=args, meta={"traceparent": tracing.current_traceparent()}
+            )
+
     async def _run_single_turn(
         self,
         anthropic_client: AsyncAnthropic,
@@ -126,18 +170,25 @@ class SummaryClient:
         claude_tools: list,
         system_prompt: str,
         user_prompt: str,
+        metrics: RouteMetrics,
     ) -> str:
         messages = [{"role": "user", "content": user_prompt}]
         final_text_parts = []
 
         while True:
-            response = await anthropic_client.messages.create(
-                model=MODEL_ID,
-                max_tokens=4096,
-                system=system_prompt,
-                tools=claude_tools,
-                messages=messages,
-            )
+            with tracing.span("claude.messages.create", model=metrics.model, turn=metrics.turns + 1) as turn_span:
+                response = await anthropic_client.messages.create(
+                    model=metrics.model,
+                    max_tokens=4096,
+                    system=system_prompt,
+                    tools=claude_tools,
+                    messages=messages,
+                )
+                usage = getattr(response, "usage", None)
+                turn_span.set_attribute("input_tokens", getattr(usage, "input_tokens", None))
+                turn_span.set_attribute("output_tokens", getattr(usage, "output_tokens", None))
+                turn_span.set_attribute("stop_reason", getattr(response, "stop_reason", None))
+            metrics.add_usage(usage)
             logger.info("Claude response content: %s", response.content)
             messages.append({"role": "assistant", "content": response.content})
 
@@ -154,10 +205,11 @@ class SummaryClient:
                 call_id = tool_call.id
                 logger.info("Claude usa: %s", name)
                 if name == "get_mcp_resource":
-                    res = await mcp_session.read_resource(args["uri"])
+                    with tracing.span("mcp.read_resource", uri=args["uri"]):
+                        res = await mcp_session.read_resource(args["uri"])
                     result_text = res.contents[0].text
                 else:
-                    res = await mcp_session.call_tool(name, arguments=args)
+                    res = await self._call_tool(mcp_session, name, args)
                     result_text = res.content[0].text
                 messages.append({
                     "role": "user",
@@ -168,35 +220,57 @@ class SummaryClient:
                     }],
                 })
 
-        raw = "\n".join(final_text_parts).strip() if final_text_parts else ""
-        return self._strip_html_xml(raw) if raw else ""
+        with tracing.span("summary.postprocess"):
+            raw = "\n".join(final_text_parts).strip() if final_text_parts else ""
+            return self._strip_html_xml(raw) if raw else ""
 
     async def generate_summary_async(self, case_id: str) -> str:
         """
         Genera el resumen del caso vía Claude + MCP (async).
         Conecta a MCP, una sola petición, devuelve el texto.
         """
-        anthropic_client = AsyncAnthropic(api_key=self._api_key)
-        server_params = StdioServerParameters(
-            command=self._path_python,
-            args=[self._path_server],
-            env=os.environ.copy(),
-        )
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as mcp_session:
-                await mcp_session.initialize()
-                mcp_tools_raw = await mcp_session.list_tools()
-                mcp_resources = await mcp_session.list_resources()
+        with tracing.span("summary.generate", case_id=case_id):
+            anthropic_client = self._anthropic_client or AsyncAnthropic(api_key=self._api_key)
+            env = os.environ.copy()
+            env[tracing.TRACEPARENT_ENV] = tracing.current_traceparent()
+            server_params = StdioServerParameters(
+                command=self._path_python,
+                args=[self._path_server],
+                env=env,
+            )
+            async with AsyncExitStack() as stack:
+                with tracing.span("summary.mcp_spawn"):
+                    read, write = await stack.enter_async_context(stdio_client(server_params))
+                    mcp_session = await stack.enter_async_context(ClientSession(read, write))
+                with tracing.span("summary.mcp_initialize"):
+                    await mcp_session.initialize()
+                with tracing.span("summary.mcp_list"):
+                    mcp_tools_raw = await mcp_session.list_tools()
+                    mcp_resources = await mcp_session.list_resources()
                 claude_tools = self._convert_tools_mcp(mcp_tools_raw)
                 system_prompt = self._get_system_instruction(mcp_resources)
                 user_prompt = self._get_case_summary_prompt(case_id)
-                return await self._run_single_turn(
-                    anthropic_client,
-                    mcp_session,
-                    claude_tools,
-                    system_prompt,
-                    user_prompt,
-                )                           
+
+                tool_names = {tool.name for tool in mcp_tools_raw.tools}
+                with tracing.span("summary.route") as route_span:
+                    document_count, text_size = await self._get_case_size(mcp_session, tool_names, case_id)
+                    route = self._router.route(document_count, text_size)
+                    route_span.set_attribute("route", route.name)
+                    route_span.set_attribute("model", route.model)
+                metrics = self._router.start(case_id, route)
+                started = time.perf_counter()
+                try:
+                    return await self._run_single_turn(
+                        anthropic_client,
+                        mcp_session,
+                        claude_tools,
+                        system_prompt,
+                        user_prompt,
+                        metrics,
+                    )
+                finally:
+                    metrics.finish((time.perf_counter() - started) * 1000)
+                    self._router.record(metrics)
 
     def generate_summary(self, case_id: str) -> str:
         """
@@ -0,0 +1,132 @@
+"""
+Trazas por spans con exportación a un fichero JSON lines (una línea por span).
+Solo biblioteca estándar: lo usan la app Flask, SummaryClient y el subproceso server.py.
+El contexto se propaga entre procesos con el formato W3C traceparent
+(variable de entorno TRACEPARENT o `_meta.traceparent` de las peticiones MCP).
+Sin TRACE_FILE los spans se siguen propagando pero no se escriben.
+"""
+
+import json
+import os
+import secrets
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+TRACE_FILE_ENV = "TRACE_FILE"
+TRACEPARENT_ENV = "TRACEPARENT"
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    trace_id: str
+    span_id: str
+
+    def to_traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+_current: ContextVar[Optional[SpanContext]] = ContextVar("current_span", default=None)
+_trace_file: Optional[str] = os.environ.get(TRACE_FILE_ENV) or None
+_write_lock = threading.Lock()
+
+
+def configure(trace_file: Optional[str]) -> None:
+    """Fichero de exportación (None o vacío desactiva la escritura)."""
+    global _trace_file
+    _trace_file = trace_file or None
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[SpanContext]:
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return SpanContext(trace_id=parts[1], span_id=parts[2])
+
+
+def current_traceparent() -> Optional[str]:
+    ctx = _current.get()
+    return ctx.to_traceparent() if ctx else None
+
+
+def _export(record: Dict[str, Any]) -> None:
+    if not _trace_file:
+        return
+    line = json.dumps(record, ensure_ascii=False, default=str)
+    try:
+        with _write_lock, open(_trace_file, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError:
+        pass
+
+
+class Span:
+    """
+    Span activo mientras dura el bloque `with`. El padre es `parent` si se indica,
+    si no el span actual del contexto, y si no hay ninguno TRACEPARENT del entorno.
+    """
+
+    def __init__(self, name: str, parent: Optional[SpanContext] = None, **attributes: Any):
+        self.name = name
+        self.attributes = dict(attributes)
+        parent = parent or _current.get() or parse_traceparent(os.environ.get(TRACEPARENT_ENV))
+        self.parent_id = parent.span_id if parent else None
+        self.context = SpanContext(
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+        )
+        self._token = None
+        self._start = 0.0
+        self._start_perf = 0.0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self._start = time.time()
+        self._start_perf = time.perf_counter()
+        self._token = _current.set(self.context)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        duration_ms = (time.perf_counter() - self._start_perf) * 1000
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+        if exc is not None:
+            self.attributes["error"] = f"{exc_type.__name__}: {exc}"
+        _export({
+            "trace_id": self.context.trace_id,
+            "span_id": self.context.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self._start,
+            "duration_ms": duration_ms,
+            "pid": os.getpid(),
+            "attributes": self.attributes,
+        })
+        return False
+
+
+def span(name: str, parent: Optional[SpanContext] = None, **attributes: Any) -> Span:
+    return Span(name, parent=parent, **attributes)
+
+
+def record_span(name: str, start: float, duration_ms: float, parent: Optional[SpanContext] = None,
+                **attributes: Any) -> None:
+    """Exporta un span ya medido (p. ej. el arranque del proceso, medido antes de tener contexto)."""
+    parent = parent or _current.get() or parse_traceparent(os.environ.get(TRACEPARENT_ENV))
+    _export({
+        "trace_id": parent.trace_id if parent else secrets.token_hex(16),
+        "span_id": secrets.token_hex(8),
+        "parent_id": parent.span_id if parent else None,
+        "name": name,
+        "start": start,
+        "duration_ms": duration_ms,
+        "pid": os.getpid(),
+        "attributes": attributes,
+    })
@@ -0,0 +1,48 @@
+"""Flask CLI commands (run with `flask --app app <command>`)."""
+
+import click
+from flask import Flask
+
+
+@click.command("ensure-indexes")
+def ensure_indexes_command():
+    """Create the case listing and per-case query indexes (idempotent; run once per deploy)."""
+    from app.models.indexes import ensure_indexes
+
+    ensure_indexes()
+    click.echo("Indexes ensured")
+
+
+@click.command("rebuild-case-stats")
+@click.option("--batch-size", default=1000, show_default=True, help="Aggregation cursor and bulk write batch size.")
+def rebuild_case_stats_command(batch_size: int):
+    """Recompute the case_stats collection from notes, calls and WhatsApp messages."""
+    from app.models import case_stats
+
+    total = case_stats.rebuild(batch_size=batch_size)
+    click.echo(f"Rebuilt case_stats: {total} cases")
+
+
+@click.command("export-cases")
+@click.option("--format", "fmt", type=click.Choice(["ndjson", "parquet"]), default="ndjson", show_default=True)
+@click.option("--output", "-o", required=True, type=click.Path(dir_okay=False, writable=True), help="Output file.")
+@click.option("--batch-size", default=1000, show_default=True, help="Server-side cursor batch size.")
+def export_cases_command(fmt: str, output: str, batch_size: int):
+    """Export every case (notes, calls and WhatsApp messages) to one NDJSON or Parquet file."""
+    from app.services.export_service import ExportUnavailableError, export_chunks
+
+    stats = {}
+    try:
+        chunks = export_chunks(fmt, batch_size=batch_size, stats=stats)
+    except (ValueError, ExportUnavailableError) as e:
+        raise click.ClickException(str(e))
+    with open(output, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    click.echo(f"Exported {stats.get('documents', 0)} documents to {output}")
+
+
+def register_commands(app: Flask) -> None:
+    app.cli.add_command(ensure_indexes_command)
+    app.cli.add_command(rebuild_case_stats_command)
+    app.cli.add_command(export_cases_command)
@@ -1,9 +1,56 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from pymongo import MongoClient
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred
 
 # Set by create_app(); used by MongoModel for persistence
 db = None
+# Same database with the configured read preference (e.g. secondaryPreferred); set by create_app().
+# Used for list and summary reads; writes and read-your-writes lookups stay on `db` (primary).
+read_db = None
+
+_session = ContextVar("mongo_session", default=None)
+
+_READ_PREFERENCES = {
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
 
 
 def get_db(uri):
     client = MongoClient(uri)
     return client
+
+
+def read_preference(mode: str, max_staleness_seconds: int = -1):
+    """
+    Build a pymongo read preference from its name (primary, secondaryPreferred, ...).
+    max_staleness_seconds is ignored for primary (-1 means no limit; otherwise MongoDB requires >= 90).
+    """
+    if mode == "primary":
+        return Primary()
+    if mode not in _READ_PREFERENCES:
+        raise ValueError(f"unknown read preference: {mode}")
+    return _READ_PREFERENCES[mode](max_staleness=max_staleness_seconds)
+
+
+def current_session():
+    """Causally consistent session of the current request, if any (pass as `session=`)."""
+    return _session.get()
+
+
+@contextmanager
+def causal_session():
+    """
+    Run the block in a causally consistent session: a read on a secondary waits until that
+    secondary has applied everything read or written earlier in the block on the primary.
+    """
+    with db.client.start_session(causal_consistency=True) as session:
+        token = _session.set(session)
+        try:
+            yield session
+        finally:
+            _session.reset(token)
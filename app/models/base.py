@@ -6,6 +6,7 @@ from bson import ObjectId
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.db_connection import db
+from app.models import case_stats
 
 
 class MongoModel(BaseModel):
@@ -18,18 +19,42 @@ class MongoModel(BaseModel):
     date: str = Field(..., description="The date of the document")
     text: str = Field(..., description="The text of the document")
 
+    def _to_document(self) -> dict:
+        """Fields written to MongoDB (subclasses may change how they are stored)."""
+        return self.model_dump(by_alias=True, exclude_none=True)
+
+    def _stale_fields(self, data: dict) -> list:
+        """Fields to unset on update because the new version of the document no longer has them."""
+        return []
+
+    def _on_replaced(self, previous: dict, data: dict) -> None:
+        """Hook called after an update with the previous stored document and the fields written."""
+
     def save(self, collection_name: str) -> "MongoModel":
-        """Save or update the document in the specified collection."""
-        data = self.model_dump(by_alias=True, exclude_none=True)
+        """Save or update the document in the specified collection and its case stats."""
+        data = self._to_document()
+        size = case_stats.text_size(self.text)
 
         if self.id is None:
             data.pop("_id", None)
             result = db[collection_name].insert_one(data)
             self.id = str(result.inserted_id)
+            case_stats.record_write(self.case_id, collection_name, self.date, size, inserted=True)
         else:
             data.pop("_id", None)
-            db[collection_name].update_one(
+            update = {"$set": data}
+            stale = self._stale_fields(data)
+            if stale:
+                update["$unset"] = {name: "" for name in stale}
+            previous = db[collection_name].find_one_and_update(
                 {"_id": ObjectId(self.id)},
-                {"$set": data},
+                update,
+                projection={"text": 1, "text_size": 1, "text_storage": 1, "text_file_id": 1},
             )
+            if previous is not None:
+                self._on_replaced(previous, data)
+                old_size = case_stats.stored_text_size(previous)
+                case_stats.record_write(
+                    self.case_id, collection_name, self.date, size - old_size, inserted=False
+                )
         return self
@@ -2,6 +2,7 @@
 
 from pydantic import Field
 
+from app.models import transcripts
 from app.models.base import MongoModel
 
 
@@ -12,6 +13,18 @@ class Call(MongoModel):
     conversation_init: str = Field(..., description="Conversation start timestamp")
     conversation_end: str = Field(..., description="Conversation end timestamp")
 
+    def _to_document(self) -> dict:
+        """Large transcripts are stored compressed (see app.models.transcripts)."""
+        data = super()._to_document()
+        data.update(transcripts.encode(self.text))
+        return data
+
+    def _stale_fields(self, data: dict) -> list:
+        return transcripts.stale_fields(data)
+
+    def _on_replaced(self, previous: dict, data: dict) -> None:
+        transcripts.discard(previous, data)
+
     def save(self) -> "Call":
         """Persist to the calls collection."""
         return super().save("phone_call_transcriptions")
@@ -0,0 +1,181 @@
+"""Materialised per-case statistics kept in the case_stats collection."""
+
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+
+from app.db_connection import current_session, db, read_db
+
+CASE_STATS_COLLECTION = "case_stats"
+
+# Collections whose documents feed case_stats (one count per source)
+SOURCE_COLLECTIONS = ("notes", "phone_call_transcriptions", "whatsapp_messages")
+
+# Sortable fields for the case listing; _id (the case_id) is the keyset tiebreaker
+SORT_FIELDS = ("last_date", "first_date", "total_docs", "text_size")
+
+
+def text_size(text: str) -> int:
+    """Size of a document text in UTF-8 bytes (same unit as $strLenBytes)."""
+    return len((text or "").encode("utf-8"))
+
+
+def stored_text_size(doc: dict) -> int:
+    """Original text size of a stored document (compressed documents keep it in text_size)."""
+    if doc.get("text_size") is not None:
+        return doc["text_size"]
+    return text_size(doc.get("text"))
+
+
+def record_write(case_id: str, source: str, date: str, size_delta: int, inserted: bool) -> None:
+    """
+    Apply one document write to the case stats with a single atomic upsert.
+    `inserted` bumps the per-source and total counts; updates only adjust size and dates.
+    Every write bumps the case version (used as the ETag of case-scoped GETs).
+    """
+    inc = {"text_size": size_delta, "version": 1}
+    if inserted:
+        inc[f"counts.{source}"] = 1
+        inc["total_docs"] = 1
+    db[CASE_STATS_COLLECTION].update_one(
+        {"_id": case_id},
+        {"$inc": inc, "$min": {"first_date": date}, "$max": {"last_date": date}},
+        upsert=True,
+    )
+
+
+def get_version(case_id: str) -> int:
+    """Current version of a case (0 if it has no documents yet)."""
+    doc = db[CASE_STATS_COLLECTION].find_one({"_id": case_id}, {"version": 1}, session=current_session())
+    return (doc or {}).get("version", 0)
+
+
+def ensure_indexes(collection=None) -> None:
+    """Create the keyset indexes used by the case listing (idempotent)."""
+    collection = collection if collection is not None else db[CASE_STATS_COLLECTION]
+    for field in SORT_FIELDS:
+        collection.create_index([(field, DESCENDING), ("_id", DESCENDING)])
+
+
+def _bulk_write(collection, ops: list, batch_size: int) -> list:
+    """Flush `ops` once it reaches batch_size; returns the (possibly emptied) op list."""
+    if len(ops) >= batch_size:
+        collection.bulk_write(ops, ordered=False)
+        return []
+    return ops
+
+
+def _has_documents(case_id: str) -> bool:
+    """Whether any source collection has a document of the case (e.g. written during a rebuild)."""
+    return any(db[source].find_one({"case_id": case_id}, {"_id": 1}) for source in SOURCE_COLLECTIONS)
+
+
+def rebuild(batch_size: int = 1000) -> int:
+    """
+    Recompute case_stats from the source collections with one $group per source.
+    Totals are accumulated in a scratch collection, then $set onto the live documents
+    one case at a time; the live collection is never replaced, and every rebuilt case
+    gets its version bumped so no ETag handed out earlier is reused.
+    Cases left without documents are zeroed rather than deleted (their version must survive).
+    Returns the number of cases with documents.
+    """
+    scratch = db[CASE_STATS_COLLECTION + "_rebuild"]
+    scratch.drop()
+    for source in SOURCE_COLLECTIONS:
+        pipeline = [
+            {"$group": {
+                "_id": "$case_id",
+                "count": {"$sum": 1},
+                "first_date": {"$min": "$date"},
+                "last_date": {"$max": "$date"},
+                "text_size": {"$sum": {"$ifNull": [
+                    "$text_size",
+                    {"$strLenBytes": {"$ifNull": ["$text", ""]}},
+                ]}},
+            }},
+        ]
+        cursor = db[source].aggregate(pipeline, allowDiskUse=True, batchSize=batch_size)
+        ops = []
+        for row in cursor:
+            ops.append(UpdateOne(
+                {"_id": row["_id"]},
+                {
+                    "$inc": {
+                        f"counts.{source}": row["count"],
+                        "total_docs": row["count"],
+                        "text_size": row["text_size"],
+                    },
+                    "$min": {"first_date": row["first_date"]},
+                    "$max": {"last_date": row["last_date"]},
+                },
+                upsert=True,
+            ))
+            ops = _bulk_write(scratch, ops, batch_size)
+        if ops:
+            scratch.bulk_write(ops, ordered=False)
+
+    live = db[CASE_STATS_COLLECTION]
+    total, ops = 0, []
+    for row in scratch.find({}, batch_size=batch_size):
+        stats = {field: row[field] for field in ("counts", "total_docs", "text_size", "first_date", "last_date")}
+        ops.append(UpdateOne({"_id": row["_id"]}, {"$set": stats, "$inc": {"version": 1}}, upsert=True))
+        ops = _bulk_write(live, ops, batch_size)
+        total += 1
+    if ops:
+        live.bulk_write(ops, ordered=False)
+
+    # Cases whose documents are all gone: keep the document (and its version), zero the stats.
+    # Both cursors are sorted by _id, so the live ids missing from scratch come out of one merge pass.
+    rebuilt = scratch.find({}, {"_id": 1}, sort=[("_id", ASCENDING)], batch_size=batch_size)
+    rebuilt_id = next(rebuilt, {}).get("_id")
+    ops = []
+    for row in live.find({}, {"_id": 1}, sort=[("_id", ASCENDING)], batch_size=batch_size):
+        while rebuilt_id is not None and rebuilt_id < row["_id"]:
+            rebuilt_id = next(rebuilt, {}).get("_id")
+        if row["_id"] == rebuilt_id or _has_documents(row["_id"]):
+            continue
+        ops.append(UpdateOne(
+            {"_id": row["_id"]},
+            {
+                "$set": {"counts": {}, "total_docs": 0, "text_size": 0},
+                "$unset": {"first_date": "", "last_date": ""},
+                "$inc": {"version": 1},
+            },
+        ))
+        ops = _bulk_write(live, ops, batch_size)
+    if ops:
+        live.bulk_write(ops, ordered=False)
+
+    scratch.drop()
+    return total
+
+
+def _keyset_filter(field: str, direction: int, value, case_id: str) -> dict:
+    op = "$lt" if direction == DESCENDING else "$gt"
+    if field == "_id":
+        return {"_id": {op: case_id}}
+    # A missing/null value sorts before every other value and never matches $lt/$gt
+    if value is None:
+        same_value = {field: None, "_id": {op: case_id}}
+        return same_value if direction == DESCENDING else {"$or": [{field: {"$ne": None}}, same_value]}
+    clauses = [{field: {op: value}}, {field: value, "_id": {op: case_id}}]
+    if direction == DESCENDING:
+        clauses.append({field: None})
+    return {"$or": clauses}
+
+
+def list_cases(sort: str = "last_date", order: str = "desc", limit: int = 50, after=None) -> list:
+    """
+    Return one page of case stats documents using keyset pagination.
+    `after` is the (sort value, case_id) pair of the last row of the previous page.
+    Cases zeroed by rebuild() (no documents left) are not listed.
+    """
+    field = "_id" if sort == "case_id" else sort
+    direction = ASCENDING if order == "asc" else DESCENDING
+    query = {"total_docs": {"$gt": 0}}
+    if after is not None:
+        value, case_id = after
+        query = {"$and": [query, _keyset_filter(field, direction, value, case_id)]}
+    sort_spec = [(field, direction)]
+    if field != "_id":
+        sort_spec.append(("_id", direction))
+    cursor = read_db[CASE_STATS_COLLECTION].find(query).sort(sort_spec).limit(limit)
+    return list(cursor)
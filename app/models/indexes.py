@@ -0,0 +1,13 @@
+"""MongoDB indexes, created by `flask ensure-indexes` at deploy time (create_index is idempotent)."""
+
+from pymongo import ASCENDING, DESCENDING
+
+from app.db_connection import db
+from app.models import case_stats
+
+
+def ensure_indexes() -> None:
+    """Case stats listing indexes plus (case_id, date, _id) on every source collection."""
+    case_stats.ensure_indexes()
+    for collection_name in case_stats.SOURCE_COLLECTIONS:
+        db[collection_name].create_index([("case_id", ASCENDING), ("date", DESCENDING), ("_id", DESCENDING)])
@@ -0,0 +1,115 @@
+"""Storage of call transcripts: inline, zlib-compressed in the document, or zlib-compressed in GridFS."""
+
+import codecs
+import zlib
+from typing import Iterator
+
+import gridfs
+from bson import Binary
+
+from app.config import Config
+from app.db_connection import db
+
+STORAGE_INLINE = "inline"
+STORAGE_ZLIB = "zlib"
+STORAGE_GRIDFS = "gridfs"
+
+GRIDFS_BUCKET = "call_transcripts"
+STREAM_CHUNK_SIZE = 64 * 1024
+ZLIB_LEVEL = 6
+
+# Every field encode() may write besides `text`; the ones it does not produce are unset on update
+STORAGE_FIELDS = ("text_storage", "text_size", "text_compressed_size", "text_zlib", "text_file_id")
+
+# Fields never sent in call listings (the body is served by GET /api/calls/<id>/transcript)
+LIST_PROJECTION = {"text_zlib": 0, "text_file_id": 0}
+
+
+def _bucket() -> gridfs.GridFSBucket:
+    return gridfs.GridFSBucket(db, bucket_name=GRIDFS_BUCKET)
+
+
+def preview(text: str) -> str:
+    """First characters of the transcript kept in the main document."""
+    limit = Config.transcript_preview_chars
+    return text if len(text) <= limit else text[:limit].rstrip() + "…"
+
+
+def encode(text: str) -> dict:
+    """
+    Return the document fields that store `text`.
+    Small transcripts stay inline in `text`; larger ones keep only a preview in `text`
+    plus the compressed body in `text_zlib` or, past the GridFS threshold, in GridFS.
+    """
+    raw = text.encode("utf-8")
+    if len(raw) < Config.transcript_compress_threshold:
+        return {"text": text}
+    compressed = zlib.compress(raw, ZLIB_LEVEL)
+    fields = {
+        "text": preview(text),
+        "text_size": len(raw),
+        "text_compressed_size": len(compressed),
+    }
+    if len(raw) >= Config.transcript_gridfs_threshold:
+        fields["text_storage"] = STORAGE_GRIDFS
+        fields["text_file_id"] = _bucket().upload_from_stream(
+            "transcript.txt.zlib", compressed, metadata={"encoding": "zlib"}
+        )
+    else:
+        fields["text_storage"] = STORAGE_ZLIB
+        fields["text_zlib"] = Binary(compressed)
+    return fields
+
+
+def _compressed_chunks(doc: dict) -> Iterator[bytes]:
+    storage = doc.get("text_storage", STORAGE_INLINE)
+    if storage == STORAGE_ZLIB:
+        body = bytes(doc["text_zlib"])
+        for start in range(0, len(body), STREAM_CHUNK_SIZE):
+            yield body[start:start + STREAM_CHUNK_SIZE]
+    elif storage == STORAGE_GRIDFS:
+        with _bucket().open_download_stream(doc["text_file_id"]) as stream:
+            while True:
+                chunk = stream.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+    else:
+        raise ValueError(f"unknown transcript storage: {storage}")
+
+
+def iter_text(doc: dict) -> Iterator[str]:
+    """Yield the full transcript of a call document in decoded chunks."""
+    if doc.get("text_storage", STORAGE_INLINE) == STORAGE_INLINE:
+        yield doc.get("text") or ""
+        return
+    inflater = zlib.decompressobj()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in _compressed_chunks(doc):
+        text = decoder.decode(inflater.decompress(chunk))
+        if text:
+            yield text
+    tail = decoder.decode(inflater.flush(), final=True)
+    if tail:
+        yield tail
+
+
+def read_text(doc: dict) -> str:
+    """Return the full transcript of a call document."""
+    return "".join(iter_text(doc))
+
+
+def stale_fields(fields: dict) -> list:
+    """Storage fields a previous version of the document may have and `fields` does not set."""
+    return [name for name in STORAGE_FIELDS if name not in fields]
+
+
+def discard(previous: dict, current: dict) -> None:
+    """Delete the GridFS body of a replaced transcript, unless `current` still points to it."""
+    file_id = previous.get("text_file_id")
+    if previous.get("text_storage") != STORAGE_GRIDFS or file_id is None or file_id == current.get("text_file_id"):
+        return
+    try:
+        _bucket().delete(file_id)
+    except gridfs.errors.NoFile:
+        pass
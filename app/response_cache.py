@@ -0,0 +1,92 @@
+"""Small in-process LRU cache for case-scoped GET responses."""
+
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from flask import Response, make_response, request
+
+from app.config import Config
+
+_CACHEABLE_STATUS = (200, 204)
+
+
+class ResponseCache:
+    """Thread-safe LRU of (status, body, content type) keyed by (URL, case version)."""
+
+    def __init__(self, max_entries: int, max_body_bytes: int):
+        self._max_entries = max_entries
+        self._max_body_bytes = max_body_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, status: int, body: bytes, content_type: str) -> None:
+        if self._max_entries <= 0 or len(body) > self._max_body_bytes:
+            return
+        with self._lock:
+            self._entries[key] = (status, body, content_type)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache(Config.response_cache_max_entries, Config.response_cache_max_body_bytes)
+
+
+def _with_etag(response: Response, etag: str) -> Response:
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def conditional_by_case_version(get_version, session_factory=None):
+    """
+    Decorator for GET views scoped by the `case_id` query param.
+    Looks up the case version once; answers If-None-Match with 304, serves repeated
+    requests from the response cache and tags fresh 200/204 responses with the ETag.
+    The version is read before the view runs, so a concurrent write can only make the
+    cached body newer than its ETag, never older. `session_factory` (e.g. a causally
+    consistent Mongo session) wraps both so that also holds when the view reads from a secondary.
+    """
+    def decorator(view):
+        def _respond(case_id, args, kwargs):
+            etag = f"v{get_version(case_id)}"
+            if request.if_none_match.contains_weak(etag):
+                return _with_etag(Response(status=304), etag)
+
+            key = (request.full_path, etag)
+            cached = response_cache.get(key)
+            if cached is not None:
+                status, body, content_type = cached
+                return _with_etag(Response(body, status=status, content_type=content_type), etag)
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code not in _CACHEABLE_STATUS:
+                return response
+            response_cache.put(key, response.status_code, response.get_data(), response.content_type)
+            return _with_etag(response, etag)
+
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            case_id = request.args.get("case_id")
+            if not case_id:
+                return view(*args, **kwargs)
+            if session_factory is None:
+                return _respond(case_id, args, kwargs)
+            with session_factory():
+                return _respond(case_id, args, kwargs)
+
+        return wrapper
+
+    return decorator
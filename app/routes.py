@@ -1,15 +1,26 @@
 import json
+import unicodedata
 from pathlib import Path
+from urllib.parse import quote
 
-from flask import Blueprint, Response, jsonify, request
+from flask import Blueprint, Response, g, jsonify, request
+
+from app.ainara import tracing
+from app.db_connection import causal_session
 
 SUMMARY_DEBUG_FILE = Path(__file__).resolve().parent.parent / "summary_debug.txt"
+MAX_CASES_PAGE_SIZE = 500
 
+from app.response_cache import conditional_by_case_version
+from app.services.export_service import DEFAULT_BATCH_SIZE, ExportUnavailableError, export_chunks
 from app.services.case_service import (
+    get_call_transcript,
     get_calls_by_case_id,
+    get_case_version,
     get_messages_by_case_id,
     get_notes_by_case_id,
     get_summary_by_case_id,
+    list_cases,
     save_call,
     save_message,
     save_note,
@@ -18,6 +29,33 @@ from app.services.case_service import (
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 
 
+@api_bp.before_request
+def start_request_span():
+    """Root span of the request; service, SummaryClient and MCP spans nest under it."""
+    g.trace_span = tracing.span(
+        f"{request.method} {request.path}",
+        method=request.method,
+        path=request.path,
+        case_id=request.args.get("case_id"),
+    )
+    g.trace_span.__enter__()
+
+
+@api_bp.after_request
+def tag_request_span(response):
+    span = g.get("trace_span")
+    if span is not None:
+        span.set_attribute("status", response.status_code)
+    return response
+
+
+@api_bp.teardown_request
+def end_request_span(exc):
+    span = g.pop("trace_span", None)
+    if span is not None:
+        span.__exit__(type(exc) if exc else None, exc, None)
+
+
 @api_bp.route("/")
 def index():
     return "Hello, World!"
@@ -33,6 +71,7 @@ def create_note():
 
 
 @api_bp.route("/notes", methods=["GET"])
+@conditional_by_case_version(get_case_version, causal_session)
 def get_notes():
     case_id = request.args.get("case_id")
     if not case_id:
@@ -52,6 +91,7 @@ def create_call():
     return jsonify(saved), 201
 
 @api_bp.route("/calls", methods=["GET"])
+@conditional_by_case_version(get_case_version, causal_session)
 def get_calls():
     case_id = request.args.get("case_id")
     if not case_id:
@@ -61,6 +101,16 @@ def get_calls():
         return "", 204
     return jsonify(calls), 200
 
+@api_bp.route("/calls/<call_id>/transcript", methods=["GET"])
+def get_call_transcript_body(call_id):
+    try:
+        chunks = get_call_transcript(call_id)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if chunks is None:
+        return jsonify({"error": "call not found"}), 404
+    return Response(chunks, mimetype="text/plain; charset=utf-8", status=200)
+
 @api_bp.route("/whatsapp-chats", methods=["POST"])
 def create_whatsapp_chat():
     data = request.get_json(silent=True) or {}
@@ -71,6 +121,7 @@ def create_whatsapp_chat():
 
 
 @api_bp.route("/whatsapp-chats", methods=["GET"])
+@conditional_by_case_version(get_case_version, causal_session)
 def get_whatsapp_chats():
     case_id = request.args.get("case_id")
     if not case_id:
@@ -80,7 +131,58 @@ def get_whatsapp_chats():
         return "", 204
     return jsonify(whatsapp_chats), 200
 
+@api_bp.route("/cases", methods=["GET"])
+def get_cases():
+    try:
+        limit = int(request.args.get("limit", 50))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    limit = max(1, min(limit, MAX_CASES_PAGE_SIZE))
+    try:
+        page = list_cases(
+            sort=request.args.get("sort", "last_date"),
+            order=request.args.get("order", "desc"),
+            limit=limit,
+            cursor=request.args.get("cursor"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(page), 200
+
+def _set_attachment(response: Response, filename: str) -> None:
+    """Content-Disposition with a quoted filename; non-ASCII names also get filename* (RFC 5987)."""
+    try:
+        filename.encode("ascii")
+    except UnicodeEncodeError:
+        ascii_name = unicodedata.normalize("NFKD", filename).encode("ascii", "ignore").decode("ascii")
+        response.headers.set(
+            "Content-Disposition", "attachment",
+            filename=ascii_name, **{"filename*": "UTF-8''" + quote(filename, safe="")},
+        )
+    else:
+        response.headers.set("Content-Disposition", "attachment", filename=filename)
+
+
+@api_bp.route("/cases/<case_id>/export", methods=["GET"])
+def export_case(case_id):
+    fmt = request.args.get("format", "ndjson")
+    try:
+        batch_size = int(request.args.get("batch_size", DEFAULT_BATCH_SIZE))
+    except ValueError:
+        return jsonify({"error": "batch_size must be an integer"}), 400
+    try:
+        chunks = export_chunks(fmt, case_id=case_id, batch_size=max(1, batch_size))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except ExportUnavailableError as e:
+        return jsonify({"error": str(e)}), 501
+    mimetype = "application/x-ndjson" if fmt == "ndjson" else "application/vnd.apache.parquet"
+    response = Response(chunks, mimetype=mimetype, status=200)
+    _set_attachment(response, f"{case_id}.{fmt}")
+    return response
+
 @api_bp.route("/summary", methods=["GET"])
+@conditional_by_case_version(get_case_version, causal_session)
 def get_summary():
     case_id = request.args.get("case_id")
     if not case_id:
@@ -1,17 +1,25 @@
 from app.services.case_service import (
+    get_call_transcript,
     get_calls_by_case_id,
+    get_case_version,
     get_messages_by_case_id,
     get_notes_by_case_id,
+    list_cases,
     save_call,
     save_message,
     save_note,
 )
+from app.services.export_service import export_chunks
 
 __all__ = [
     "get_notes_by_case_id",
     "save_note",
     "get_calls_by_case_id",
     "save_call",
+    "get_call_transcript",
     "get_messages_by_case_id",
     "save_message",
+    "list_cases",
+    "get_case_version",
+    "export_chunks",
 ]
@@ -1,12 +1,18 @@
 """Single service for notes, calls, and WhatsApp messages (get by case_id and save)."""
 
+import base64
+import json
+
 from bson import ObjectId
+from bson.errors import InvalidId
 
-from app.db_connection import db
+from app.ainara import tracing
+from app.config import Config
+from app.db_connection import current_session, db, read_db
+from app.models import case_stats, transcripts
 from app.models.calls import Call
 from app.models.message import Message
 from app.models.notes import Note
-from app.ainara.summary_client import SummaryClient
 
 def _to_json_safe(doc):
     """Convert a MongoDB doc to a JSON-serializable dict (ObjectId -> str)."""
@@ -27,8 +33,9 @@ def save_note(data: dict):
 
 def get_notes_by_case_id(case_id: str):
     """Return list of notes for the given case_id (JSON-safe dicts), newest first."""
-    cursor = db["notes"].find({"case_id": case_id}).sort("date", -1)
-    return [_to_json_safe(doc) for doc in cursor]
+    with tracing.span("case_service.get_notes", case_id=case_id):
+        cursor = read_db["notes"].find({"case_id": case_id}, session=current_session()).sort("date", -1)
+        return [_to_json_safe(doc) for doc in cursor]
 
 
 def save_call(data: dict):
@@ -39,9 +46,33 @@ def save_call(data: dict):
 
 
 def get_calls_by_case_id(case_id: str):
-    """Return list of calls for the given case_id (JSON-safe dicts), newest first."""
-    cursor = db["phone_call_transcriptions"].find({"case_id": case_id}).sort("date", -1)
-    return [_to_json_safe(doc) for doc in cursor]
+    """
+    Return list of calls for the given case_id (JSON-safe dicts), newest first.
+    Compressed transcripts only carry their preview in `text`; see get_call_transcript.
+    """
+    with tracing.span("case_service.get_calls", case_id=case_id):
+        cursor = read_db["phone_call_transcriptions"].find(
+            {"case_id": case_id}, transcripts.LIST_PROJECTION, session=current_session()
+        ).sort("date", -1)
+        return [_to_json_safe(doc) for doc in cursor]
+
+
+def get_call_transcript(call_id: str):
+    """
+    Return an iterator over the full transcript of a call, or None if the call does not exist.
+    Raises ValueError if call_id is not a valid ObjectId.
+    Read from the primary: the id usually comes straight from a save_call response.
+    """
+    try:
+        oid = ObjectId(call_id)
+    except (InvalidId, TypeError):
+        raise ValueError("invalid call id")
+    doc = db["phone_call_transcriptions"].find_one(
+        {"_id": oid}, {"text": 1, "text_storage": 1, "text_zlib": 1, "text_file_id": 1}
+    )
+    if doc is None:
+        return None
+    return transcripts.iter_text(doc)
 
 
 def save_message(data: dict):
@@ -53,8 +84,56 @@ def save_message(data: dict):
 
 def get_messages_by_case_id(case_id: str):
     """Return list of WhatsApp messages for the given case_id (JSON-safe dicts), newest first."""
-    cursor = db["whatsapp_messages"].find({"case_id": case_id}).sort("date", -1)
-    return [_to_json_safe(doc) for doc in cursor]
+    with tracing.span("case_service.get_messages", case_id=case_id):
+        cursor = read_db["whatsapp_messages"].find({"case_id": case_id}, session=current_session()).sort("date", -1)
+        return [_to_json_safe(doc) for doc in cursor]
+
+
+def get_case_version(case_id: str) -> int:
+    """Return the case version, bumped on every save_* write for that case (read from the primary)."""
+    return case_stats.get_version(case_id)
+
+
+def _encode_cursor(value, case_id: str) -> str:
+    """Opaque keyset cursor: base64 of the last row's (sort value, case_id)."""
+    raw = json.dumps([value, case_id], ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str):
+    try:
+        value, case_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, TypeError):
+        raise ValueError("invalid cursor")
+    if not isinstance(case_id, str):
+        raise ValueError("invalid cursor")
+    return value, case_id
+
+
+def list_cases(sort: str = "last_date", order: str = "desc", limit: int = 50, cursor: str | None = None):
+    """
+    Return a page of cases from the case_stats collection plus the cursor for the next page.
+    Raises ValueError on an unknown sort/order or a malformed cursor.
+    """
+    if sort != "case_id" and sort not in case_stats.SORT_FIELDS:
+        raise ValueError(f"sort must be one of: case_id, {', '.join(case_stats.SORT_FIELDS)}")
+    if order not in ("asc", "desc"):
+        raise ValueError("order must be asc or desc")
+    after = _decode_cursor(cursor) if cursor else None
+    # One extra row tells whether there is a next page, so a full last page needs no empty follow-up
+    docs = case_stats.list_cases(sort=sort, order=order, limit=limit + 1, after=after)
+    has_more = len(docs) > limit
+    docs = docs[:limit]
+    cases = []
+    for doc in docs:
+        case = {"case_id": doc.pop("_id")}
+        case.update(doc)
+        cases.append(case)
+    next_cursor = None
+    if has_more:
+        last = cases[-1]
+        next_cursor = _encode_cursor(last.get(sort), last["case_id"])
+    return {"cases": cases, "next_cursor": next_cursor}
 
 
 def get_summary_by_case_id(case_id: str) -> str:
@@ -63,6 +142,20 @@ def get_summary_by_case_id(case_id: str) -> str:
     Invocado desde el endpoint POST /api/summary.
     Lanza excepción si falla la conexión MCP o la API de Claude.
     """
-    summary_client = SummaryClient()
-    summary = summary_client.generate_summary(case_id)
-    return summary
+    with tracing.span("case_service.get_summary", case_id=case_id):
+        # Imported on first use: anthropic + mcp are heavy and only needed for summaries
+        with tracing.span("case_service.import_summary_stack"):
+            from app.ainara.model_router import ModelRouter
+            from app.ainara.summary_client import SummaryClient
+
+        summary_client = SummaryClient(router=ModelRouter.from_config(Config))
+        summary = summary_client.generate_summary(case_id)
+        return summary
+
+
+def preload_summary_stack() -> None:
+    """
+    Import the summary dependencies (anthropic, mcp) now instead of on the first summary.
+    For preforking servers (e.g. gunicorn --preload): the import cost is paid once in the master.
+    """
+    import app.ainara.summary_client  # noqa: F401
@@ -0,0 +1,179 @@
+"""
+Streaming export of case histories: notes, calls and WhatsApp messages merged into one
+record stream and written as NDJSON or Parquet, chunk by chunk with bounded memory.
+"""
+
+import heapq
+import json
+from typing import Iterable, Iterator, Optional
+
+from app.db_connection import read_db
+from app.models import transcripts
+
+EXPORT_FORMATS = ("ndjson", "parquet")
+DEFAULT_BATCH_SIZE = 1000
+PARQUET_ROW_GROUP_SIZE = 5000
+NDJSON_CHUNK_BYTES = 64 * 1024
+
+
+class ExportUnavailableError(RuntimeError):
+    """The requested format needs an optional dependency that is not installed on the server."""
+
+
+# (collection, value of the `source` field)
+SOURCES = (
+    ("notes", "note"),
+    ("phone_call_transcriptions", "call"),
+    ("whatsapp_messages", "whatsapp"),
+)
+
+FIELDS = (
+    "source",
+    "id",
+    "case_id",
+    "date",
+    "sender",
+    "text",
+    "conversation_id",
+    "conversation_init",
+    "conversation_end",
+)
+
+# Same order as the list endpoints (newest first); served by the (case_id, date, _id) indexes
+_SORT = [("case_id", 1), ("date", -1), ("_id", -1)]
+
+
+class _Descending:
+    """Sort key wrapper that inverts the order of a value (for heapq.merge on mixed directions)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def _record(source: str, doc: dict) -> dict:
+    text = transcripts.read_text(doc) if source == "call" else doc.get("text")
+    record = {field: doc.get(field) for field in FIELDS}
+    record.update(source=source, id=str(doc["_id"]), text=text)
+    return record
+
+
+def _source_records(collection_name: str, source: str, query: dict, batch_size: int) -> Iterator[dict]:
+    cursor = read_db[collection_name].find(query, sort=_SORT, batch_size=batch_size)
+    try:
+        for doc in cursor:
+            yield _record(source, doc)
+    finally:
+        cursor.close()
+
+
+def iter_records(case_id: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[dict]:
+    """
+    Merge the three collections into one stream ordered by case_id, then newest first.
+    One server-side cursor per collection; only one batch per cursor is held in memory.
+    """
+    query = {"case_id": case_id} if case_id is not None else {}
+    streams = [_source_records(name, source, query, batch_size) for name, source in SOURCES]
+    return heapq.merge(*streams, key=lambda r: (r["case_id"] or "", _Descending(r["date"] or "")))
+
+
+def _ndjson_chunks(records: Iterable[dict]) -> Iterator[bytes]:
+    buffer, size = [], 0
+    for record in records:
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        buffer.append(line)
+        size += len(line)
+        if size >= NDJSON_CHUNK_BYTES:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+class _ChunkSink:
+    """Write-only file object for pyarrow that hands written bytes back to a generator."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _parquet_chunks(records: Iterable[dict], pa, pq) -> Iterator[bytes]:
+    schema = pa.schema([(field, pa.string()) for field in FIELDS])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    batch = []
+    try:
+        for record in records:
+            batch.append(record)
+            if len(batch) >= PARQUET_ROW_GROUP_SIZE:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                batch = []
+                yield sink.drain()
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def export_chunks(fmt: str, case_id: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                  stats: Optional[dict] = None) -> Iterator[bytes]:
+    """
+    Return an iterator of encoded chunks for one case (or every case if case_id is None).
+    `stats`, if given, gets the running number of exported documents in stats["documents"].
+    Raises ValueError for an unknown format and ExportUnavailableError if Parquet is
+    requested without pyarrow installed.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+
+    records = iter_records(case_id, batch_size)
+    if stats is not None:
+        records = _counted(records, stats)
+    if fmt == "ndjson":
+        return _ndjson_chunks(records)
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ExportUnavailableError("parquet export requires pyarrow, which is not installed on the server")
+    return _parquet_chunks(records, pa, pq)
+
+
+def _counted(records: Iterable[dict], stats: dict) -> Iterator[dict]:
+    stats["documents"] = 0
+    for record in records:
+        stats["documents"] += 1
+        yield record
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Measure the streaming case export (flask export-cases) against a live MongoDB.
+Seeds a scratch database with synthetic notes, calls and WhatsApp messages spread over
+many cases and creates the indexes, then exports everything once per format in a fresh
+subprocess and reports documents/sec, output MB/s and the peak RSS of that subprocess. Peak RSS should stay flat
+as --docs grows; throughput should scale with it. The scratch database is dropped at the end.
+Parquet needs pyarrow (optional dependency).
+
+Usage: MONGO_CONNECTION_STRING=mongodb://localhost:27017 \\
+  python scripts/bench_export.py [--docs 100000] [--cases 500] [--formats ndjson,parquet] [--batch-size 1000]
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+COLLECTIONS = ("notes", "phone_call_transcriptions", "whatsapp_messages")
+INSERT_BATCH = 5000
+
+# Runs in the child process so its peak RSS is measured on its own
+_CHILD = """
+import resource, sys, time
+sys.path.insert(0, {root!r})
+from app import create_app
+from app.services.export_service import export_chunks
+fmt, output, batch_size = sys.argv[1], sys.argv[2], int(sys.argv[3])
+with create_app().app_context():
+    stats = {{}}
+    start = time.perf_counter()
+    with open(output, "wb") as f:
+        for chunk in export_chunks(fmt, batch_size=batch_size, stats=stats):
+            f.write(chunk)
+    elapsed = time.perf_counter() - start
+print(stats["documents"], elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def _seed(db, docs, cases, rng):
+    words = "la hija de carmen llama preocupada por su madre cuidadora domicilio propuesta visita".split()
+    batches = {name: [] for name in COLLECTIONS}
+    for i in range(docs):
+        name = COLLECTIONS[i % len(COLLECTIONS)]
+        doc = {
+            "case_id": f"CASE-{rng.randrange(cases):05d}",
+            "date": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "text": " ".join(rng.choice(words) for _ in range(rng.randint(20, 200))),
+        }
+        if name == "whatsapp_messages":
+            doc["sender"] = "Laura"
+        batches[name].append(doc)
+        if len(batches[name]) >= INSERT_BATCH:
+            db[name].insert_many(batches[name], ordered=False)
+            batches[name] = []
+    for name, batch in batches.items():
+        if batch:
+            db[name].insert_many(batch, ordered=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--cases", type=int, default=500)
+    parser.add_argument("--formats", default="ndjson,parquet")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    from app.config import Config
+    from app.db_connection import get_db
+
+    db_name = f"ainara-export-bench-{uuid.uuid4().hex[:8]}"
+    client = get_db(Config.mongo_connection_string)
+    db = client[db_name]
+    env = dict(os.environ, MONGO_DATABASE_NAME=db_name)
+    try:
+        start = time.perf_counter()
+        _seed(db, args.docs, args.cases, random.Random(42))
+        import app.db_connection as db_connection
+        db_connection.db = db
+        from app.models.indexes import ensure_indexes
+        ensure_indexes()
+        print(f"seeded {args.docs} documents in {args.cases} cases ({time.perf_counter() - start:.1f}s)")
+
+        # ru_maxrss is in KiB on Linux, bytes on macOS
+        rss_unit = 1 if sys.platform == "darwin" else 1024
+        print(f"{'format':<8} {'docs':>9} {'seconds':>8} {'docs/s':>9} {'MB':>8} {'MB/s':>7} {'peak RSS MB':>12}")
+        with tempfile.TemporaryDirectory() as tmp:
+            for fmt in args.formats.split(","):
+                output = Path(tmp) / f"export.{fmt}"
+                result = subprocess.run(
+                    [sys.executable, "-c", _CHILD.format(root=str(ROOT)), fmt, str(output), str(args.batch_size)],
+                    env=env, capture_output=True, text=True,
+                )
+                if result.returncode != 0:
+                    print(f"{fmt:<8} failed:\n{result.stderr.strip()}")
+                    continue
+                documents, elapsed, max_rss = result.stdout.split()[-3:]
+                documents, elapsed = int(documents), float(elapsed)
+                mb = output.stat().st_size / 1e6
+                rss_mb = int(max_rss) * rss_unit / 1e6
+                print(f"{fmt:<8} {documents:>9} {elapsed:>8.2f} {documents / elapsed:>9.0f} "
+                      f"{mb:>8.1f} {mb / elapsed:>7.1f} {rss_mb:>12.1f}")
+    finally:
+        client.drop_database(db_name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Startup benchmark for the Flask app and the MCP server.
+Each run uses a fresh interpreter and measures:
+  - app: import time of `app`, create_app() time and time to the first request (GET /api/),
+    and checks that anthropic/mcp were not imported (they load on the first summary);
+  - mcp: import time of server.py, and time from spawn to initialize and to the first list_tools.
+Exits with status 1 if the median of a total exceeds its threshold.
+No MongoDB needed: the client connects lazily and GET /api/ does not query it.
+
+Usage: python scripts/bench_startup.py [--runs 5] [--max-app-ms 1500] [--max-mcp-ms 3000]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVER = ROOT / "app" / "ainara" / "server.py"
+
+APP_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+from app import create_app
+t1 = time.perf_counter()
+app = create_app()
+t2 = time.perf_counter()
+app.test_client().get("/api/")
+t3 = time.perf_counter()
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1000,
+    "create_app_ms": (t2 - t1) * 1000,
+    "first_request_ms": (t3 - t2) * 1000,
+    "total_ms": (t3 - t0) * 1000,
+    "llm_stack_loaded": "anthropic" in sys.modules or "mcp" in sys.modules,
+}))
+"""
+
+SERVER_IMPORT_PROBE = """
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+t0 = time.perf_counter()
+import server
+print(json.dumps({"import_ms": (time.perf_counter() - t0) * 1000}))
+"""
+
+
+def _run_probe(code, *args):
+    out = subprocess.run(
+        [sys.executable, "-c", code, *args],
+        cwd=ROOT, env=os.environ.copy(), capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+async def _mcp_first_request():
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    params = StdioServerParameters(command=sys.executable, args=[str(SERVER)], env=os.environ.copy())
+    t0 = time.perf_counter()
+    async with stdio_client(params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            t1 = time.perf_counter()
+            await session.list_tools()
+            t2 = time.perf_counter()
+    return {"initialize_ms": (t1 - t0) * 1000, "total_ms": (t2 - t0) * 1000}
+
+
+def _median(rows, key):
+    return statistics.median(row[key] for row in rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-app-ms", type=float, default=1500.0, help="Threshold for app import + first request.")
+    parser.add_argument("--max-mcp-ms", type=float, default=3000.0, help="Threshold for MCP spawn to first list_tools.")
+    args = parser.parse_args()
+
+    app_rows = [_run_probe(APP_PROBE) for _ in range(args.runs)]
+    server_rows = [_run_probe(SERVER_IMPORT_PROBE, str(SERVER.parent)) for _ in range(args.runs)]
+    mcp_rows = [asyncio.run(_mcp_first_request()) for _ in range(args.runs)]
+
+    app_total = _median(app_rows, "total_ms")
+    mcp_total = _median(mcp_rows, "total_ms")
+    print(f"app  import {_median(app_rows, 'import_ms'):8.1f} ms   create_app {_median(app_rows, 'create_app_ms'):8.1f} ms   "
+          f"first request {_median(app_rows, 'first_request_ms'):8.1f} ms   total {app_total:8.1f} ms")
+    print(f"mcp  import {_median(server_rows, 'import_ms'):8.1f} ms   initialize {_median(mcp_rows, 'initialize_ms'):8.1f} ms   "
+          f"first list_tools total {mcp_total:8.1f} ms")
+
+    failures = []
+    preload = os.environ.get("PRELOAD_SUMMARY_STACK", "").lower() in ("1", "true", "yes")
+    if any(row["llm_stack_loaded"] for row in app_rows) and not preload:
+        failures.append("anthropic/mcp imported during app startup")
+    if app_total > args.max_app_ms:
+        failures.append(f"app startup {app_total:.1f} ms > {args.max_app_ms:.1f} ms")
+    if mcp_total > args.max_mcp_ms:
+        failures.append(f"MCP first request {mcp_total:.1f} ms > {args.max_mcp_ms:.1f} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Measure storage and transfer savings of compressed call transcripts.
+Builds synthetic transcripts of growing size from the utterances in scripts/data/
+and compares, per size, the inline document against the stored (compressed) one:
+document bytes, bytes sent by GET /api/calls listings, and compress/decompress time.
+No database needed.
+
+Usage: python scripts/bench_transcript_storage.py [--sizes 2000,20000,200000,2000000] [--calls 50]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import zlib
+from pathlib import Path
+
+from bson import BSON, Binary, ObjectId
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.config import Config  # noqa: E402
+from app.models.transcripts import ZLIB_LEVEL, preview  # noqa: E402
+
+CALLS_FILE = ROOT / "scripts" / "data" / "ainara-db.phone_call_transcriptions.json"
+
+
+def _utterances():
+    calls = json.loads(CALLS_FILE.read_text(encoding="utf-8"))
+    parts = []
+    for call in calls:
+        parts.extend(p.strip() for p in call["text"].split(";") if p.strip())
+    return parts
+
+
+def _synthetic_transcript(utterances, size, rng):
+    """
+    Random sequence of real utterances (shuffled so zlib cannot just match one repeated block).
+    The sample pool is small, so ratios for the largest sizes are optimistic.
+    """
+    out, total = [], 0
+    while total < size:
+        part = rng.choice(utterances)
+        out.append(part)
+        total += len(part.encode("utf-8")) + 2
+    return "; ".join(out)
+
+
+def _listing_bytes(doc):
+    return len(json.dumps(doc, ensure_ascii=False).encode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="2000,20000,200000,2000000", help="Transcript sizes in bytes.")
+    parser.add_argument("--calls", type=int, default=50, help="Calls per case in the simulated listing.")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    utterances = _utterances()
+    meta = {"case_id": "BENCH-1", "date": "2026-01-01", "conversation_id": "1",
+            "conversation_init": "2026-01-01T10:00:00", "conversation_end": "2026-01-01T10:30:00"}
+
+    print(f"compress >= {Config.transcript_compress_threshold} B, gridfs >= {Config.transcript_gridfs_threshold} B, "
+          f"preview {Config.transcript_preview_chars} chars, zlib level {ZLIB_LEVEL}")
+    print(f"{'size':>10} {'zlib':>10} {'ratio':>6} {'doc inline':>11} {'doc stored':>11} "
+          f"{'list inline':>12} {'list stored':>12} {'comp ms':>8} {'decomp ms':>9}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        text = _synthetic_transcript(utterances, size, rng)
+        raw = text.encode("utf-8")
+
+        t0 = time.perf_counter()
+        compressed = zlib.compress(raw, ZLIB_LEVEL)
+        t1 = time.perf_counter()
+        zlib.decompress(compressed)
+        t2 = time.perf_counter()
+
+        inline_doc = dict(meta, text=text)
+        stored_doc = dict(meta, text=preview(text), text_size=len(raw), text_compressed_size=len(compressed),
+                          text_storage="zlib", text_zlib=Binary(compressed))
+        listed_doc = {k: v for k, v in stored_doc.items() if k != "text_zlib"}
+        if len(raw) < Config.transcript_compress_threshold:
+            stored_doc = listed_doc = inline_doc
+        elif len(raw) >= Config.transcript_gridfs_threshold:
+            stored_doc.pop("text_zlib")
+            stored_doc.update(text_storage="gridfs", text_file_id=ObjectId())
+
+        print(f"{len(raw):>10} {len(compressed):>10} {len(raw) / len(compressed):>6.2f} "
+              f"{len(BSON.encode(inline_doc)):>11} {len(BSON.encode(stored_doc)):>11} "
+              f"{_listing_bytes(inline_doc) * args.calls:>12} {_listing_bytes(listed_doc) * args.calls:>12} "
+              f"{(t1 - t0) * 1000:>8.2f} {(t2 - t1) * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
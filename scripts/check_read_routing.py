@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Check read/write routing against a replica set (see scripts/local_replica_set.sh).
+Records which member served each Mongo command while exercising the API and verifies:
+  - writes (insert/update) and the case version lookup go to the primary;
+  - list reads (notes, case listing) go to a secondary with the default secondaryPreferred;
+  - a GET right after a POST already returns the new document (causal session).
+Uses a scratch database that is dropped at the end. Exits with status 1 on any failure.
+
+Usage:
+  MONGO_CONNECTION_STRING="mongodb://localhost:27117,localhost:27118,localhost:27119/?replicaSet=rs0" \\
+    python scripts/check_read_routing.py
+"""
+
+import os
+import sys
+import uuid
+from pathlib import Path
+
+from pymongo import monitoring
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("MONGO_DATABASE_NAME", f"ainara-routing-check-{uuid.uuid4().hex[:8]}")
+
+
+class _CommandRecorder(monitoring.CommandListener):
+    def __init__(self):
+        self.events = []
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        self.events.append((event.command_name, collection, event.connection_id))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+    def served_by(self, command_name, collection):
+        return {addr for name, coll, addr in self.events if name == command_name and coll == collection}
+
+
+def main():
+    recorder = _CommandRecorder()
+    monitoring.register(recorder)
+
+    from app import create_app
+    import app.db_connection as db_connection
+
+    flask_app = create_app({"TESTING": True})
+    client = flask_app.test_client()
+    mongo = db_connection.db.client
+    failures = []
+    try:
+        mongo.admin.command("ping")
+        primary = mongo.primary
+        secondaries = mongo.secondaries
+        print(f"primary {primary}, secondaries {sorted(secondaries)}")
+        if not secondaries:
+            print("FAIL: no secondaries (is this a replica set?)")
+            sys.exit(1)
+
+        case_id = "ROUTING-CHECK"
+        for i in range(3):
+            body = {"case_id": case_id, "text": f"note {i}", "date": f"2026-01-0{i + 1}"}
+            created = client.post("/api/notes", json=body)
+            listed = client.get(f"/api/notes?case_id={case_id}")
+            if created.status_code != 201 or listed.status_code != 200 or len(listed.get_json()) != i + 1:
+                failures.append(f"read-your-writes: GET after POST #{i + 1} returned {listed.status_code}")
+        client.get("/api/cases?limit=10")
+
+        checks = [
+            ("insert", "notes", {primary}, "note insert"),
+            ("update", "case_stats", {primary}, "case stats upsert"),
+            ("find", "notes", secondaries, "notes list"),
+        ]
+        for command, collection, expected, label in checks:
+            served = recorder.served_by(command, collection)
+            status = "ok" if served and served <= expected else "FAIL"
+            print(f"  {status:<4} {label:<20} served by {sorted(served)}")
+            if status != "ok":
+                failures.append(f"{label} served by {sorted(served)}")
+
+        # case_stats finds: version lookups on the primary, the case listing on a secondary
+        case_stats_finds = recorder.served_by("find", "case_stats")
+        status = "ok" if primary in case_stats_finds and case_stats_finds & secondaries else "FAIL"
+        print(f"  {status:<4} {'case_stats reads':<20} served by {sorted(case_stats_finds)}")
+        if status != "ok":
+            failures.append(f"case_stats finds served by {sorted(case_stats_finds)}")
+    finally:
+        mongo.drop_database(db_connection.db.name)
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
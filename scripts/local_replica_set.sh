@@ -0,0 +1,54 @@
+#!/usr/bin/env bash
+# Start (or stop) a local 3-member replica set of mongod processes for testing read routing.
+# Usage: ./scripts/local_replica_set.sh [start|stop]
+# Members: localhost:27117 (preferred primary), localhost:27118, localhost:27119; replica set rs0.
+# Requires: mongod and mongosh in PATH.
+# Connection string for the app:
+#   MONGO_CONNECTION_STRING="mongodb://localhost:27117,localhost:27118,localhost:27119/?replicaSet=rs0"
+
+set -e
+ACTION="${1:-start}"
+RS_NAME="rs0"
+PORTS=(27117 27118 27119)
+BASE_DIR="${RS_DIR:-/tmp/ainara-rs}"
+
+if [[ "$ACTION" == "stop" ]]; then
+  for port in "${PORTS[@]}"; do
+    if [[ -f "$BASE_DIR/$port/mongod.pid" ]]; then
+      kill "$(cat "$BASE_DIR/$port/mongod.pid")" 2>/dev/null || true
+      echo "  stopped mongod :$port"
+    fi
+  done
+  exit 0
+fi
+
+for cmd in mongod mongosh; do
+  if ! command -v "$cmd" &>/dev/null; then
+    echo "Error: $cmd is required"
+    exit 1
+  fi
+done
+
+for port in "${PORTS[@]}"; do
+  mkdir -p "$BASE_DIR/$port"
+  mongod --replSet "$RS_NAME" --port "$port" --bind_ip localhost \
+    --dbpath "$BASE_DIR/$port" --logpath "$BASE_DIR/$port/mongod.log" \
+    --pidfilepath "$BASE_DIR/$port/mongod.pid" --fork >/dev/null
+  echo "  started mongod :$port"
+done
+
+mongosh --quiet --port "${PORTS[0]}" --eval "
+try { rs.status(); print('  replica set already initiated'); } catch (e) {
+  rs.initiate({_id: '$RS_NAME', members: [
+    {_id: 0, host: 'localhost:${PORTS[0]}', priority: 2},
+    {_id: 1, host: 'localhost:${PORTS[1]}', priority: 1},
+    {_id: 2, host: 'localhost:${PORTS[2]}', priority: 1},
+  ]});
+  print('  replica set initiated');
+}
+while (!db.hello().isWritablePrimary) { sleep(200); }
+print('  primary: ' + db.hello().primary);
+"
+
+echo ""
+echo "MONGO_CONNECTION_STRING=\"mongodb://localhost:${PORTS[0]},localhost:${PORTS[1]},localhost:${PORTS[2]}/?replicaSet=$RS_NAME\""
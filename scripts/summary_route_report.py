@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Per-route report of summary latency, tokens and cost from the JSON lines written by ModelRouter
+to SUMMARY_METRICS_FILE (disabled by default; e.g. SUMMARY_METRICS_FILE=summary_routes.jsonl).
+Use it to tune the SUMMARY_FAST_MAX_* thresholds: est/actual compares the input token estimate
+with the real usage.
+
+Usage: python scripts/summary_route_report.py summary_routes.jsonl
+"""
+
+import json
+import statistics
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(2)
+    path = Path(sys.argv[1])
+    if not path.exists():
+        print(f"No metrics file at {path}")
+        sys.exit(1)
+    by_route = defaultdict(list)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                by_route[(row["route"], row["model"])].append(row)
+
+    print(f"{'route':<7} {'model':<28} {'n':>5} {'p50 ms':>8} {'p95 ms':>8} {'avg in':>8} {'avg out':>8} "
+          f"{'est/actual':>10} {'avg $':>8} {'total $':>9}")
+    for (route, model), rows in sorted(by_route.items()):
+        latencies = [r["latency_ms"] for r in rows]
+        ratios = [r["estimated_input_tokens"] / r["input_tokens"] for r in rows if r["input_tokens"]]
+        print(f"{route:<7} {model:<28} {len(rows):>5} {_percentile(latencies, 0.5):>8.0f} "
+              f"{_percentile(latencies, 0.95):>8.0f} {statistics.mean(r['input_tokens'] for r in rows):>8.0f} "
+              f"{statistics.mean(r['output_tokens'] for r in rows):>8.0f} "
+              f"{(statistics.mean(ratios) if ratios else 0):>10.2f} "
+              f"{statistics.mean(r['cost_usd'] for r in rows):>8.4f} {sum(r['cost_usd'] for r in rows):>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
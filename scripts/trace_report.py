@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Flame-style breakdown of one trace from the spans file written with TRACE_FILE.
+Prints the span tree with its offset from the root start, its duration, its self time
+(duration not covered by child spans) and a bar proportional to its share of the root.
+By default shows the latest trace whose root is a summary request.
+
+Usage: python scripts/trace_report.py traces.jsonl [trace_id]
+"""
+
+import json
+import sys
+from collections import defaultdict
+
+BAR_WIDTH = 40
+MAX_ATTRS_CHARS = 120
+
+
+def _load(path):
+    traces = defaultdict(list)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                span = json.loads(line)
+                traces[span["trace_id"]].append(span)
+    return traces
+
+
+def _pick_trace(traces, trace_id):
+    if trace_id:
+        return trace_id if trace_id in traces else None
+    candidates = []
+    for tid, spans in traces.items():
+        roots = [s for s in spans if s["parent_id"] is None]
+        if any(s["name"].endswith("/api/summary") or s["name"] == "summary.generate" for s in roots):
+            candidates.append((max(s["start"] for s in roots), tid))
+    return max(candidates)[1] if candidates else None
+
+
+def _print_tree(span, children, root_start, root_ms, depth):
+    kids = sorted(children[span["span_id"]], key=lambda s: s["start"])
+    self_ms = max(0.0, span["duration_ms"] - sum(k["duration_ms"] for k in kids))
+    offset_ms = (span["start"] - root_start) * 1000
+    share = span["duration_ms"] / root_ms if root_ms else 0
+    bar = "█" * max(1, round(share * BAR_WIDTH))
+    attrs = {k: v for k, v in span.get("attributes", {}).items() if v is not None}
+    attrs_text = json.dumps(attrs, ensure_ascii=False) if attrs else ""
+    if len(attrs_text) > MAX_ATTRS_CHARS:
+        attrs_text = attrs_text[:MAX_ATTRS_CHARS - 1] + "…"
+    label = "  " * depth + span["name"]
+    print(f"{label:<48} {offset_ms:>9.1f} {span['duration_ms']:>10.1f} {self_ms:>9.1f} {share * 100:>5.1f}%  "
+          f"{bar:<{BAR_WIDTH}} {attrs_text}")
+    for kid in kids:
+        _print_tree(kid, children, root_start, root_ms, depth + 1)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(2)
+    traces = _load(sys.argv[1])
+    trace_id = _pick_trace(traces, sys.argv[2] if len(sys.argv) > 2 else None)
+    if trace_id is None:
+        print("Trace not found")
+        sys.exit(1)
+
+    spans = traces[trace_id]
+    ids = {s["span_id"] for s in spans}
+    children = defaultdict(list)
+    roots = []
+    for s in spans:
+        # Spans whose parent was not exported (e.g. written to another file) are shown as roots
+        if s["parent_id"] in ids:
+            children[s["parent_id"]].append(s)
+        else:
+            roots.append(s)
+    roots.sort(key=lambda s: s["start"])
+    root_start = roots[0]["start"]
+    root_ms = max((s["start"] - root_start) * 1000 + s["duration_ms"] for s in roots)
+
+    print(f"trace {trace_id}  {len(spans)} spans  {root_ms:.1f} ms")
+    print(f"{'span':<48} {'start ms':>9} {'dur ms':>10} {'self ms':>9} {'share':>6}")
+    for root in roots:
+        _print_tree(root, children, root_start, root_ms, 0)
+
+
+if __name__ == "__main__":
+    main()
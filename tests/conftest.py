@@ -0,0 +1,42 @@
+import contextlib
+import sys
+from pathlib import Path
+
+import pytest
+
+# Run from anywhere: make the `app` package importable without installing it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(scope="session")
+def mongo_client():
+    """In-memory MongoDB (mongomock, see requirements-dev.txt) shared by the whole run."""
+    mongomock = pytest.importorskip("mongomock")
+    client = mongomock.MongoClient()
+    # mongomock has no sessions; causal_session() only needs a context manager
+    client.start_session = lambda **kwargs: contextlib.nullcontext()
+    return client
+
+
+@pytest.fixture
+def flask_app(mongo_client, monkeypatch):
+    """
+    App wired to the in-memory database, emptied after each test.
+    Models and services bind `db` at first import, so every test shares the same client.
+    """
+    import app
+    from app.config import Config
+
+    monkeypatch.setattr(app, "get_db", lambda uri: mongo_client)
+    flask_app = app.create_app({"TESTING": True})
+    yield flask_app
+
+    from app.response_cache import response_cache
+
+    mongo_client.drop_database(Config.mongo_database_name)
+    response_cache.clear()
+
+
+@pytest.fixture
+def client(flask_app):
+    return flask_app.test_client()
@@ -0,0 +1,93 @@
+import pytest
+
+
+def add_note(client, case_id, date, text="nota"):
+    response = client.post("/api/notes", json={"case_id": case_id, "date": date, "text": text})
+    assert response.status_code == 201
+
+
+def add_zeroed_case(case_id):
+    """A case rebuild() zeroed: no documents left, dates unset, version kept."""
+    from app.db_connection import db
+
+    db.case_stats.insert_one({"_id": case_id, "version": 3, "counts": {}, "total_docs": 0, "text_size": 0})
+
+
+def walk(client, **params):
+    """Follow next_cursor through every page; returns the case ids in order."""
+    seen, cursor = [], None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        response = client.get("/api/cases", query_string=query)
+        assert response.status_code == 200
+        page = response.get_json()
+        assert len(page["cases"]) <= int(params.get("limit", 50))
+        seen += [case["case_id"] for case in page["cases"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+@pytest.fixture
+def cases(client):
+    add_note(client, "A", "2026-01-03")
+    add_note(client, "B", "2026-01-01")
+    add_note(client, "B", "2026-01-05")
+    add_note(client, "C", "2026-01-03")
+    add_note(client, "D", "2026-01-02")
+    add_zeroed_case("Z0")
+    add_zeroed_case("Z1")
+
+
+@pytest.mark.parametrize("limit", [1, 2, 4, 50])
+@pytest.mark.parametrize("sort, order, expected", [
+    ("last_date", "desc", ["B", "C", "A", "D"]),
+    ("last_date", "asc", ["D", "A", "C", "B"]),
+    ("first_date", "asc", ["B", "D", "A", "C"]),
+    ("total_docs", "desc", ["B", "D", "C", "A"]),
+    ("case_id", "asc", ["A", "B", "C", "D"]),
+    ("case_id", "desc", ["D", "C", "B", "A"]),
+])
+def test_page_walk_visits_every_case_once_and_skips_zeroed(client, cases, sort, order, expected, limit):
+    assert walk(client, sort=sort, order=order, limit=limit) == expected
+
+
+def test_full_last_page_has_no_next_cursor(client, cases):
+    page = client.get("/api/cases?limit=4").get_json()
+    assert len(page["cases"]) == 4
+    assert page["next_cursor"] is None
+
+
+def test_case_fields(client, cases):
+    [case] = [c for c in client.get("/api/cases").get_json()["cases"] if c["case_id"] == "B"]
+    assert case["total_docs"] == 2
+    assert case["counts"] == {"notes": 2}
+    assert (case["first_date"], case["last_date"]) == ("2026-01-01", "2026-01-05")
+
+
+@pytest.mark.parametrize("query", ["sort=nope", "order=up", "cursor=not-base64!", "limit=abc"])
+def test_invalid_params(client, query):
+    response = client.get(f"/api/cases?{query}")
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+def test_cursor_round_trip():
+    from app.services.case_service import _decode_cursor, _encode_cursor
+
+    for value in ("2026-01-03", 7, None, "ñandú"):
+        assert _decode_cursor(_encode_cursor(value, "ABC-123")) == (value, "ABC-123")
+    with pytest.raises(ValueError):
+        _decode_cursor(_encode_cursor("2026-01-03", 5))
+
+
+def test_keyset_filter_after_null_value():
+    """Missing/null values sort first: asc continues into real values, desc stays among nulls."""
+    from pymongo import ASCENDING, DESCENDING
+
+    from app.models.case_stats import _keyset_filter
+
+    assert _keyset_filter("last_date", ASCENDING, None, "Z0") == {
+        "$or": [{"last_date": {"$ne": None}}, {"last_date": None, "_id": {"$gt": "Z0"}}]
+    }
+    assert _keyset_filter("last_date", DESCENDING, None, "Z1") == {"last_date": None, "_id": {"$lt": "Z1"}}
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+
+def test_invalid_batch_size(client):
+    response = client.get("/api/cases/ABC-123/export?batch_size=abc")
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "batch_size must be an integer"}
+
+
+def test_unknown_format(client):
+    response = client.get("/api/cases/ABC-123/export?format=xml")
+    assert response.status_code == 400
+
+
+def record(source, case_id, date, index):
+    return {"source": source, "id": f"{source}-{index}", "case_id": case_id, "date": date}
+
+
+SOURCE_ROWS = {
+    # each already in the (case_id asc, date desc) order the Mongo cursors return
+    "notes": [("A", "2026-03-01"), ("A", "2026-01-01"), ("C", "2026-02-01")],
+    "phone_call_transcriptions": [("A", "2026-02-15"), ("B", "2026-05-01"), ("B", "2026-01-01"), ("C", "2026-02-01")],
+    "whatsapp_messages": [("A", "2026-03-01"), ("A", "2025-12-31"), ("B", "2026-03-03"), ("D", "2026-01-01")],
+}
+
+
+@pytest.fixture
+def export_service(monkeypatch):
+    from app.services import export_service
+
+    sources = dict(export_service.SOURCES)
+
+    def fake_source_records(collection_name, source, query, batch_size):
+        assert source == sources[collection_name]
+        for index, (case_id, date) in enumerate(SOURCE_ROWS[collection_name]):
+            if query.get("case_id", case_id) == case_id:
+                yield record(source, case_id, date, index)
+
+    monkeypatch.setattr(export_service, "_source_records", fake_source_records)
+    return export_service
+
+
+def test_merge_orders_by_case_then_newest_first(export_service):
+    rows = [(r["case_id"], r["date"]) for r in export_service.iter_records()]
+    assert len(rows) == sum(len(v) for v in SOURCE_ROWS.values())
+    assert rows == sorted(rows, key=lambda row: row[0])
+    for case_id in {case_id for case_id, _ in rows}:
+        dates = [date for c, date in rows if c == case_id]
+        assert dates == sorted(dates, reverse=True)
+
+
+def test_merge_keeps_every_source(export_service):
+    sources = [r["source"] for r in export_service.iter_records(case_id="A")]
+    assert sorted(sources) == ["call", "note", "note", "whatsapp", "whatsapp"]
+
+
+def test_ndjson_export_of_a_case(client):
+    client.post("/api/notes", json={"case_id": "A", "date": "2026-01-03", "text": "nota"})
+    client.post("/api/whatsapp-chats", json={"case_id": "A", "date": "2026-01-05", "text": "hola", "sender": "Laura"})
+    client.post("/api/calls", json={
+        "case_id": "A", "date": "2026-01-04", "text": "llamada " * 2000,
+        "conversation_id": "c1", "conversation_init": "10:00", "conversation_end": "10:20",
+    })
+    client.post("/api/notes", json={"case_id": "B", "date": "2026-01-09", "text": "otro caso"})
+
+    response = client.get("/api/cases/A/export")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert response.headers["Content-Disposition"] == 'attachment; filename=A.ndjson'
+    records = [json.loads(line) for line in response.data.decode("utf-8").splitlines()]
+    assert [(r["source"], r["date"]) for r in records] == [
+        ("whatsapp", "2026-01-05"), ("call", "2026-01-04"), ("note", "2026-01-03"),
+    ]
+    # compressed transcripts are exported in full
+    assert records[1]["text"] == "llamada " * 2000
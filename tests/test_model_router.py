@@ -0,0 +1,72 @@
+from app.ainara.model_router import (
+    BYTES_PER_TOKEN,
+    PER_DOCUMENT_OVERHEAD_TOKENS,
+    PROMPT_OVERHEAD_TOKENS,
+    ModelRouter,
+)
+
+
+def make_router(**overrides):
+    settings = dict(fast_model="fast", strong_model="strong", fast_max_input_tokens=8000, fast_max_documents=20)
+    settings.update(overrides)
+    return ModelRouter(**settings)
+
+
+def test_estimate_input_tokens():
+    assert ModelRouter.estimate_input_tokens(0, 0) == PROMPT_OVERHEAD_TOKENS
+    assert ModelRouter.estimate_input_tokens(2, 4000) == (
+        PROMPT_OVERHEAD_TOKENS + 2 * PER_DOCUMENT_OVERHEAD_TOKENS + 4000 // BYTES_PER_TOKEN
+    )
+
+
+def test_small_case_goes_to_fast_model():
+    route = make_router().route(3, 2000)
+    assert (route.name, route.model, route.document_count) == ("fast", "fast", 3)
+    assert route.estimated_input_tokens == ModelRouter.estimate_input_tokens(3, 2000)
+
+
+def test_document_threshold_is_inclusive():
+    router = make_router()
+    assert router.route(20, 0).name == "fast"
+    assert router.route(21, 0).name == "strong"
+
+
+def test_token_threshold_is_inclusive():
+    router = make_router()
+    # text size that lands exactly on the token limit with one document
+    at_limit = (8000 - PROMPT_OVERHEAD_TOKENS - PER_DOCUMENT_OVERHEAD_TOKENS) * BYTES_PER_TOKEN
+    assert router.route(1, at_limit).name == "fast"
+    assert router.route(1, at_limit + BYTES_PER_TOKEN).name == "strong"
+
+
+def test_unknown_size_goes_to_strong_model():
+    router = make_router()
+    assert router.route(None, None).name == "strong"
+    assert router.route(3, None).model == "strong"
+    assert router.route(None, 100).model == "strong"
+
+
+def test_from_config():
+    class FakeConfig:
+        summary_fast_model = "f"
+        summary_strong_model = "s"
+        summary_fast_max_input_tokens = PROMPT_OVERHEAD_TOKENS + 100
+        summary_fast_max_documents = 1
+        summary_metrics_file = ""
+
+    router = ModelRouter.from_config(FakeConfig)
+    assert router.route(1, 0).model == "f"
+    assert router.route(2, 0).model == "s"
+    assert router.metrics_file == ""
+
+
+def test_record_appends_metrics_line(tmp_path):
+    metrics_file = tmp_path / "routes.jsonl"
+    router = make_router(metrics_file=str(metrics_file))
+    metrics = router.start("ABC-123", router.route(2, 100))
+    metrics.finish(12.5)
+    router.record(metrics)
+    router.record(metrics)
+    lines = metrics_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert '"route": "fast"' in lines[0] and '"case_id": "ABC-123"' in lines[0]
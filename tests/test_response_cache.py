@@ -0,0 +1,99 @@
+"""ETag / If-None-Match / response cache of case-scoped GETs (conditional_by_case_version)."""
+
+import pytest
+
+
+@pytest.fixture
+def notes_reads(flask_app, monkeypatch):
+    """Count how many times GET /api/notes actually queries the notes."""
+    import app.routes as routes
+
+    calls = []
+    original = routes.get_notes_by_case_id
+
+    def counting(case_id):
+        calls.append(case_id)
+        return original(case_id)
+
+    monkeypatch.setattr(routes, "get_notes_by_case_id", counting)
+    return calls
+
+
+def add_note(client, text, case_id="ABC-123"):
+    response = client.post("/api/notes", json={"case_id": case_id, "date": "2026-01-18", "text": text})
+    assert response.status_code == 201
+
+
+def test_unknown_case_gets_204_with_etag(client):
+    response = client.get("/api/notes?case_id=NOPE")
+    assert response.status_code == 204
+    assert response.headers["ETag"] == '"v0"'
+    assert response.headers["Cache-Control"] == "no-cache"
+
+
+def test_fresh_200_has_version_etag(client):
+    add_note(client, "primera")
+    add_note(client, "segunda")
+    response = client.get("/api/notes?case_id=ABC-123")
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"v2"'
+    assert len(response.get_json()) == 2
+
+
+def test_matching_if_none_match_gets_empty_304(client, notes_reads):
+    add_note(client, "primera")
+    etag = client.get("/api/notes?case_id=ABC-123").headers["ETag"]
+    response = client.get("/api/notes?case_id=ABC-123", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+    assert len(notes_reads) == 1
+
+
+def test_stale_if_none_match_gets_200(client):
+    add_note(client, "primera")
+    response = client.get("/api/notes?case_id=ABC-123", headers={"If-None-Match": '"v0"'})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"v1"'
+
+
+def test_repeated_get_is_served_from_cache(client, notes_reads):
+    add_note(client, "primera")
+    first = client.get("/api/notes?case_id=ABC-123")
+    second = client.get("/api/notes?case_id=ABC-123")
+    assert notes_reads == ["ABC-123"]
+    assert (second.status_code, second.data, second.headers["ETag"]) == (200, first.data, first.headers["ETag"])
+    assert second.content_type == first.content_type
+
+
+def test_cache_is_keyed_by_url(client, notes_reads):
+    add_note(client, "primera", case_id="A")
+    add_note(client, "segunda", case_id="B")
+    assert client.get("/api/notes?case_id=A").get_json()[0]["text"] == "primera"
+    assert client.get("/api/notes?case_id=B").get_json()[0]["text"] == "segunda"
+    assert notes_reads == ["A", "B"]
+
+
+def test_post_invalidates_cache_and_etag(client, notes_reads):
+    add_note(client, "primera")
+    before = client.get("/api/notes?case_id=ABC-123")
+    add_note(client, "segunda")
+
+    after = client.get("/api/notes?case_id=ABC-123", headers={"If-None-Match": before.headers["ETag"]})
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before.headers["ETag"]
+    assert sorted(note["text"] for note in after.get_json()) == ["primera", "segunda"]
+    assert len(notes_reads) == 2
+
+
+def test_write_to_other_case_keeps_etag(client):
+    add_note(client, "primera", case_id="A")
+    etag = client.get("/api/notes?case_id=A").headers["ETag"]
+    add_note(client, "otra", case_id="B")
+    assert client.get("/api/notes?case_id=A", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_missing_case_id_is_not_tagged(client):
+    response = client.get("/api/notes")
+    assert response.status_code == 400
+    assert "ETag" not in response.headers
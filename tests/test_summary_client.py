@@ -0,0 +1,127 @@
+"""SummaryClient with a fake Anthropic client and a fake MCP session (no subprocess, no network)."""
+
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from app.ainara import summary_client as summary_client_module
+from app.ainara.model_router import ModelRouter
+from app.ainara.summary_client import SummaryClient
+
+
+class FakeMcpSession:
+    def __init__(self, overview):
+        self.overview = overview
+        self.calls = []
+
+    async def initialize(self):
+        pass
+
+    async def list_tools(self):
+        tools = [
+            SimpleNamespace(name=name, description=name, inputSchema={"type": "object"})
+            for name in ("get_case_overview", "generate_case_summary")
+        ]
+        return SimpleNamespace(tools=tools)
+
+    async def list_resources(self):
+        return SimpleNamespace(resources=[])
+
+    async def call_tool(self, name, arguments=None, meta=None):
+        self.calls.append(name)
+        if name == "get_case_overview":
+            text = json.dumps(self.overview)
+        else:
+            text = json.dumps({"notes": ["Nota del caso"], "whatsapp": [], "transcriptions": []})
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+class FakeAnthropic:
+    """Asks for generate_case_summary on the first turn, then answers with text."""
+
+    def __init__(self):
+        self.models = []
+        self.messages = self
+
+    async def create(self, model, messages, **kwargs):
+        self.models.append(model)
+        usage = SimpleNamespace(input_tokens=1000, output_tokens=200)
+        if len(self.models) == 1:
+            tool_use = SimpleNamespace(type="tool_use", name="generate_case_summary", input={"case_id": "C-1"}, id="t1")
+            return SimpleNamespace(content=[tool_use], usage=usage, stop_reason="tool_use")
+        text = SimpleNamespace(type="text", text="<p>Resumen del caso</p>")
+        return SimpleNamespace(content=[text], usage=usage, stop_reason="end_turn")
+
+
+@pytest.fixture
+def fake_mcp(monkeypatch):
+    sessions = []
+
+    @asynccontextmanager
+    async def fake_stdio_client(server_params):
+        yield None, None
+
+    @asynccontextmanager
+    async def fake_client_session(read, write):
+        yield sessions[-1]
+
+    monkeypatch.setattr(summary_client_module, "stdio_client", fake_stdio_client)
+    monkeypatch.setattr(summary_client_module, "ClientSession", fake_client_session)
+
+    def with_overview(overview):
+        sessions.append(FakeMcpSession(overview))
+        return sessions[-1]
+
+    return with_overview
+
+
+def make_client(tmp_path, anthropic):
+    router = ModelRouter(
+        fast_model="fast-model",
+        strong_model="strong-model",
+        fast_max_input_tokens=8000,
+        fast_max_documents=20,
+        metrics_file=str(tmp_path / "routes.jsonl"),
+    )
+    return SummaryClient(router=router, anthropic_client=anthropic)
+
+
+def recorded_metrics(tmp_path):
+    return [json.loads(line) for line in (tmp_path / "routes.jsonl").read_text(encoding="utf-8").splitlines()]
+
+
+def test_small_case_uses_fast_model_and_records_metrics(tmp_path, fake_mcp):
+    session = fake_mcp({"exists": True, "total_docs": 3, "text_size": 2000})
+    anthropic = FakeAnthropic()
+
+    summary = make_client(tmp_path, anthropic).generate_summary("C-1")
+
+    assert summary == "Resumen del caso"
+    assert anthropic.models == ["fast-model", "fast-model"]
+    assert session.calls == ["get_case_overview", "generate_case_summary"]
+    [metrics] = recorded_metrics(tmp_path)
+    assert (metrics["route"], metrics["turns"], metrics["input_tokens"], metrics["output_tokens"]) == (
+        "fast", 2, 2000, 400
+    )
+
+
+def test_large_case_uses_strong_model(tmp_path, fake_mcp):
+    fake_mcp({"exists": True, "total_docs": 500, "text_size": 2_000_000})
+    anthropic = FakeAnthropic()
+
+    make_client(tmp_path, anthropic).generate_summary("C-1")
+
+    assert anthropic.models == ["strong-model", "strong-model"]
+
+
+def test_case_without_stats_uses_strong_model(tmp_path, fake_mcp):
+    # e.g. imported with mongoimport and no rebuild-case-stats yet: size unknown, not tiny
+    fake_mcp({"exists": False, "total_docs": 0, "text_size": 0})
+    anthropic = FakeAnthropic()
+
+    make_client(tmp_path, anthropic).generate_summary("C-1")
+
+    assert anthropic.models == ["strong-model", "strong-model"]
+    assert recorded_metrics(tmp_path)[0]["route"] == "strong"
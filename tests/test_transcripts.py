@@ -0,0 +1,98 @@
+"""Inline/zlib transcript storage: pure round trips, no database (GridFS is not exercised)."""
+
+import zlib
+
+import pytest
+
+from app.config import Config
+
+
+@pytest.fixture
+def transcripts(monkeypatch):
+    # Imported here: the module binds `db` at import time (unused on the inline/zlib paths)
+    from app.models import transcripts
+
+    monkeypatch.setattr(Config, "transcript_compress_threshold", 100)
+    monkeypatch.setattr(Config, "transcript_gridfs_threshold", 10_000_000)
+    monkeypatch.setattr(Config, "transcript_preview_chars", 20)
+    return transcripts
+
+
+def test_below_threshold_stays_inline(transcripts):
+    text = "Hola, ¿qué tal?"
+    fields = transcripts.encode(text)
+    assert fields == {"text": text}
+    assert transcripts.read_text(fields) == text
+    assert list(transcripts.iter_text(fields)) == [text]
+
+
+def test_above_threshold_is_zlib_compressed(transcripts):
+    text = "Laura: mi madre se olvida de las cosas. " * 50
+    fields = transcripts.encode(text)
+    raw = text.encode("utf-8")
+    assert fields["text_storage"] == transcripts.STORAGE_ZLIB
+    assert fields["text_size"] == len(raw)
+    assert fields["text_compressed_size"] == len(fields["text_zlib"]) < len(raw)
+    assert zlib.decompress(bytes(fields["text_zlib"])) == raw
+    assert fields["text"] == transcripts.preview(text)
+    assert len(fields["text"]) <= Config.transcript_preview_chars + 1
+    assert transcripts.read_text(fields) == text
+
+
+def test_threshold_is_in_utf8_bytes(transcripts):
+    # 60 characters but 120 bytes: over the 100-byte threshold
+    fields = transcripts.encode("ñ" * 60)
+    assert fields["text_storage"] == transcripts.STORAGE_ZLIB
+
+
+def test_incremental_decoding_across_multibyte_boundaries(transcripts, monkeypatch):
+    # 1-byte compressed chunks: inflated output splits inside 2-, 3- and 4-byte characters
+    monkeypatch.setattr(transcripts, "STREAM_CHUNK_SIZE", 1)
+    text = "".join(f"{i} ñandú € 😀 " for i in range(200))
+    fields = transcripts.encode(text)
+    chunks = list(transcripts.iter_text(fields))
+    assert len(chunks) > 1
+    assert "".join(chunks) == text
+
+
+def test_stale_fields_zlib_to_inline(transcripts):
+    old = transcripts.encode("x" * 500)
+    new = transcripts.encode("short now")
+    stale = set(transcripts.stale_fields(new))
+    assert stale == set(transcripts.STORAGE_FIELDS)
+    assert set(old) - {"text"} <= stale
+
+
+def test_stale_fields_inline_to_zlib(transcripts):
+    new = transcripts.encode("x" * 500)
+    assert set(transcripts.stale_fields(new)) == {"text_file_id"}
+
+
+def test_discard_ignores_non_gridfs_documents(transcripts):
+    # No GridFS file involved: must not touch the database (db is not set up here)
+    transcripts.discard(transcripts.encode("x" * 500), transcripts.encode("short"))
+    transcripts.discard({"text": "inline"}, {"text": "inline"})
+
+
+class RecordingBucket:
+    def __init__(self):
+        self.deleted = []
+
+    def delete(self, file_id):
+        self.deleted.append(file_id)
+
+
+def test_discard_keeps_file_still_referenced(transcripts, monkeypatch):
+    bucket = RecordingBucket()
+    deleted = bucket.deleted
+    monkeypatch.setattr(transcripts, "_bucket", lambda: bucket)
+    previous = {"text_storage": transcripts.STORAGE_GRIDFS, "text_file_id": "f1"}
+    transcripts.discard(previous, {"text_storage": transcripts.STORAGE_GRIDFS, "text_file_id": "f1"})
+    assert deleted == []
+    transcripts.discard(previous, {"text": "short"})
+    assert deleted == ["f1"]
+
+
+def test_unknown_storage_is_rejected(transcripts):
+    with pytest.raises(ValueError):
+        transcripts.read_text({"text_storage": "lz4", "text": "?"})